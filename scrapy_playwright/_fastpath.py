@@ -0,0 +1,57 @@
+"""
+Helpers which run for every request or network event.
+"""
+
+from contextlib import suppress
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from scrapy.http.headers import Headers
+from scrapy.utils.python import to_unicode
+from w3lib.encoding import html_body_declared_encoding, http_content_type_encoding
+
+
+# known values, used to build stats keys in advance
+RESOURCE_TYPES: Tuple[str, ...] = (
+    "document",
+    "stylesheet",
+    "image",
+    "media",
+    "font",
+    "script",
+    "texttrack",
+    "xhr",
+    "fetch",
+    "eventsource",
+    "websocket",
+    "manifest",
+    "other",
+)
+METHODS: Tuple[str, ...] = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+
+
+def make_stats_keys(prefix: str, values: Tuple[str, ...]) -> Dict[str, str]:
+    return {value: f"{prefix}/{value}" for value in values}
+
+
+@lru_cache(maxsize=128)
+def content_type_encoding(content_type: bytes) -> Optional[str]:
+    """Encoding declared in a Content-Type header value. Cached, crawls usually
+    receive the same few header values over and over."""
+    return http_content_type_encoding(to_unicode(content_type))
+
+
+def encode_body(headers: Headers, text: str) -> Tuple[bytes, str]:
+    """Encode the text using the encoding declared in the headers, falling back to the one
+    declared in the body and then to utf-8."""
+    content_type = headers.get("content-type")
+    if content_type:
+        encoding = content_type_encoding(content_type)
+        if encoding:
+            with suppress(UnicodeEncodeError):
+                return text.encode(encoding), encoding
+    encoding = html_body_declared_encoding(text)
+    if encoding:
+        with suppress(UnicodeEncodeError):
+            return text.encode(encoding), encoding
+    return text.encode("utf-8"), "utf-8"  # fallback
@@ -1,14 +1,28 @@
 import asyncio
 import logging
 import warnings
+from collections import Counter, OrderedDict, defaultdict
 from contextlib import suppress
 from inspect import isawaitable
-from ipaddress import ip_address
+from ipaddress import IPv4Address, IPv6Address, ip_address
 from time import time
-from typing import Callable, Dict, Generator, Optional, Tuple, Type, TypeVar
+from typing import (
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from playwright.async_api import (
     BrowserContext,
+    Error as PlaywrightError,
     Page,
     PlaywrightContextManager,
     Request as PlaywrightRequest,
@@ -19,16 +33,15 @@ from scrapy import Spider, signals
 from scrapy.core.downloader.handlers.http import HTTPDownloadHandler
 from scrapy.crawler import Crawler
 from scrapy.exceptions import ScrapyDeprecationWarning
-from scrapy.http import Request, Response
+from scrapy.http import Request, Response, TextResponse
 from scrapy.http.headers import Headers
 from scrapy.responsetypes import responsetypes
 from scrapy.utils.defer import deferred_from_coro
 from scrapy.utils.misc import load_object
-from scrapy.utils.python import to_unicode
 from scrapy.utils.reactor import verify_installed_reactor
 from twisted.internet.defer import Deferred, inlineCallbacks
-from w3lib.encoding import html_body_declared_encoding, http_content_type_encoding
 
+from scrapy_playwright._fastpath import METHODS, RESOURCE_TYPES, encode_body, make_stats_keys
 from scrapy_playwright.headers import use_scrapy_headers
 from scrapy_playwright.page import PageMethod
 
@@ -42,6 +55,9 @@ PlaywrightHandler = TypeVar("PlaywrightHandler", bound="ScrapyPlaywrightDownload
 logger = logging.getLogger("scrapy-playwright")
 
 
+STATS_FLUSH_INTERVAL = 0.5  # seconds
+
+
 def _make_request_logger(context_name: str) -> Callable:
     def _log_request(request: PlaywrightRequest) -> None:
         logger.debug(
@@ -63,6 +79,15 @@ def _make_response_logger(context_name: str) -> Callable:
 
 
 class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
+    _REQ_RESOURCE_TYPE_KEYS = make_stats_keys(
+        "playwright/request_count/resource_type", RESOURCE_TYPES
+    )
+    _REQ_METHOD_KEYS = make_stats_keys("playwright/request_count/method", METHODS)
+    _RESP_RESOURCE_TYPE_KEYS = make_stats_keys(
+        "playwright/response_count/resource_type", RESOURCE_TYPES
+    )
+    _RESP_METHOD_KEYS = make_stats_keys("playwright/response_count/method", METHODS)
+
     def __init__(self, crawler: Crawler) -> None:
         super().__init__(settings=crawler.settings, crawler=crawler)
         verify_installed_reactor("twisted.internet.asyncioreactor.AsyncioSelectorReactor")
@@ -74,6 +99,15 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
             "PLAYWRIGHT_MAX_PAGES_PER_CONTEXT"
         ) or crawler.settings.getint("CONCURRENT_REQUESTS")
         self.launch_options: dict = crawler.settings.getdict("PLAYWRIGHT_LAUNCH_OPTIONS") or {}
+        self.include_security_details: bool = crawler.settings.getbool(
+            "PLAYWRIGHT_INCLUDE_SECURITY_DETAILS"
+        )
+        self.max_contexts: Optional[int] = (
+            crawler.settings.getint("PLAYWRIGHT_MAX_CONTEXTS") or None
+        )
+        self.max_requests_per_context: Optional[int] = (
+            crawler.settings.getint("PLAYWRIGHT_MAX_REQUESTS_PER_CONTEXT") or None
+        )
 
         self.default_navigation_timeout: Optional[float] = None
         if "PLAYWRIGHT_DEFAULT_NAVIGATION_TIMEOUT" in crawler.settings:
@@ -90,9 +124,26 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
             self.process_request_headers = use_scrapy_headers
 
         self.context_kwargs: dict = crawler.settings.getdict("PLAYWRIGHT_CONTEXTS")
-        self.contexts: Dict[str, BrowserContext] = {}
-        self.context_semaphores: Dict[str, asyncio.Semaphore] = {}
-
+        # least recently used contexts first
+        self.contexts: "OrderedDict[str, BrowserContext]" = OrderedDict()
+        self.context_request_count: Counter = Counter()
+        self.context_locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.context_semaphores: Dict[str, asyncio.BoundedSemaphore] = {}
+        # requests holding or waiting for a page slot in each context
+        self.context_active_requests: Counter = Counter()
+        self.page_pools: Dict[str, asyncio.LifoQueue] = {}
+        self.idle_pages: Set[Page] = set()
+        self.route_handlers: Dict[Page, Callable] = {}
+        # keep references to page closing tasks, so they are not garbage collected
+        self.close_page_tasks: Set[asyncio.Future] = set()
+
+        # stats from network events are buffered and flushed periodically
+        self._stat_buffer: Counter = Counter()
+        self._stat_flush_handle: Optional[asyncio.TimerHandle] = None
+
+        self.blocked_resource_types: FrozenSet[str] = frozenset(
+            crawler.settings.getlist("PLAYWRIGHT_BLOCK_RESOURCE_TYPES")
+        )
         self.abort_request: Optional[Callable[[PlaywrightRequest], bool]] = None
         if crawler.settings.get("PLAYWRIGHT_ABORT_REQUEST"):
             self.abort_request = load_object(crawler.settings["PLAYWRIGHT_ABORT_REQUEST"])
@@ -118,34 +169,87 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
                 for name, kwargs in self.context_kwargs.items()
             ]
         )
-        self.contexts = dict(zip(self.context_kwargs.keys(), contexts))
+        self.contexts = OrderedDict(zip(self.context_kwargs.keys(), contexts))
         self.context_semaphores = {
-            name: asyncio.Semaphore(value=self.max_pages_per_context) for name in self.contexts
+            name: asyncio.BoundedSemaphore(value=self.max_pages_per_context)
+            for name in self.contexts
+        }
+        self.page_pools = {
+            name: asyncio.LifoQueue(maxsize=self.max_pages_per_context) for name in self.contexts
         }
 
     async def _create_browser_context(self, name: str, context_kwargs: dict) -> BrowserContext:
         context = await self.browser.new_context(**context_kwargs)
         context.on("close", self._make_close_browser_context_callback(name))
+        context.on("request", _make_request_logger(name))
+        context.on("response", _make_response_logger(name))
+        context.on("request", self._increment_request_stats)
+        context.on("response", self._increment_response_stats)
+        await context.route("**", self._route_request)
         logger.debug("Browser context started: '%s'", name)
         self.stats.inc_value("playwright/context_count")
         if self.default_navigation_timeout is not None:
             context.set_default_navigation_timeout(self.default_navigation_timeout)
         return context
 
-    async def _create_page(self, request: Request) -> Page:
-        """Create a new page in a context, also creating a new context if necessary."""
+    async def _acquire_page(self, request: Request) -> Page:
+        """Get an idle page from the context's pool, or create a new one if there are none.
+        Also create a new context if necessary."""
         context_name = request.meta.setdefault("playwright_context", "default")
-        context = self.contexts.get(context_name)
-        if context is None:
-            context_kwargs = request.meta.get("playwright_context_kwargs") or {}
-            context = await self._create_browser_context(context_name, context_kwargs)
-            self.contexts[context_name] = context
-            self.context_semaphores[context_name] = asyncio.Semaphore(
-                value=self.max_pages_per_context
-            )
+        # prevent concurrent requests from creating the same context more than once
+        async with self.context_locks[context_name]:
+            context = self.contexts.get(context_name)
+            if (
+                context is not None
+                and self._context_exceeded_max_requests(context_name)
+                and self._is_context_idle(context_name)
+            ):
+                await self._close_browser_context(context_name)
+                context = None
+            if context is None:
+                if self.max_contexts is not None:
+                    await self._evict_browser_contexts(self.max_contexts - 1)
+                context_kwargs = (
+                    request.meta.get("playwright_context_kwargs")
+                    or self.context_kwargs.get(context_name)
+                    or {}
+                )
+                context = await self._create_browser_context(context_name, context_kwargs)
+                self.contexts[context_name] = context
+                self.context_semaphores[context_name] = asyncio.BoundedSemaphore(
+                    value=self.max_pages_per_context
+                )
+                self.page_pools[context_name] = asyncio.LifoQueue(
+                    maxsize=self.max_pages_per_context
+                )
+            else:
+                self.contexts.move_to_end(context_name)
+            self.context_request_count[context_name] += 1
+            # count the request before waiting for a slot, the context must not be closed under it
+            self.context_active_requests[context_name] += 1
+            semaphore = self.context_semaphores[context_name]
+
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            self._discard_active_request(context_name, context)
+            raise
+
+        pool = self.page_pools.get(context_name)
+        while pool is not None and not pool.empty():
+            page = pool.get_nowait()
+            self.idle_pages.discard(page)
+            if not page.is_closed():
+                self.stats.inc_value("playwright/page_count/reused")
+                logger.debug("[Context=%s] Reusing idle page", context_name)
+                return page
 
-        await self.context_semaphores[context_name].acquire()
-        page = await context.new_page()
+        try:
+            page = await context.new_page()
+        except BaseException:
+            semaphore.release()
+            self._discard_active_request(context_name, context)
+            raise
         self.stats.inc_value("playwright/page_count")
         logger.debug(
             "[Context=%s] New page created, page count is %i (%i for all contexts)",
@@ -156,15 +260,92 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
         if self.default_navigation_timeout is not None:
             page.set_default_navigation_timeout(self.default_navigation_timeout)
 
-        page.on("close", self._make_close_page_callback(context_name))
-        page.on("crash", self._make_close_page_callback(context_name))
-        page.on("request", _make_request_logger(context_name))
-        page.on("response", _make_response_logger(context_name))
-        page.on("request", self._increment_request_stats)
-        page.on("response", self._increment_response_stats)
+        page.on("close", self._close_page_callback)
+        page.on("crash", self._crash_page_callback)
 
         return page
 
+    async def _release_page(
+        self, page: Page, context_name: str, event_handlers: List[Tuple[str, Callable]]
+    ) -> None:
+        """Return a page to its context's pool, closing it if it cannot be reused."""
+        pool = self.page_pools.get(context_name)
+        if pool is not None and not pool.full():
+            # remove the handlers first, they should not see the reset navigation
+            for event, handler in event_handlers:
+                page.remove_listener(event, handler)
+            try:
+                await page.goto("about:blank")
+                # page-level routes take precedence over the context-level one
+                await page.unroute("**")
+            except PlaywrightError:
+                logger.debug("[Context=%s] Could not reset page, closing it", context_name)
+            else:
+                self.route_handlers.pop(page, None)
+                if self.page_pools.get(context_name) is pool and not pool.full():
+                    self.idle_pages.add(page)
+                    pool.put_nowait(page)
+                    self._release_page_slot(context_name)
+                    await self._recycle_browser_contexts(context_name)
+                    return
+        if not page.is_closed():
+            await page.close()
+            self.stats.inc_value("playwright/page_count/closed")
+
+    def _release_page_slot(self, name: str) -> None:
+        self.context_semaphores[name].release()
+        self.context_active_requests[name] -= 1
+
+    def _discard_active_request(self, name: str, context: BrowserContext) -> None:
+        # a context closed from the outside might have been replaced by a new one
+        if self.contexts.get(name) is context:
+            self.context_active_requests[name] -= 1
+
+    def _is_context_idle(self, name: str) -> bool:
+        """A context is idle if no requests are using or waiting for its pages."""
+        return self.context_active_requests[name] <= 0
+
+    def _context_exceeded_max_requests(self, name: str) -> bool:
+        return (
+            self.max_requests_per_context is not None
+            and self.context_request_count[name] >= self.max_requests_per_context
+        )
+
+    async def _recycle_browser_contexts(self, name: str) -> None:
+        """Close the given context if it is idle and it has been used for too many requests,
+        then close least recently used idle contexts if there are too many of them."""
+        if self._context_exceeded_max_requests(name) and self._is_context_idle(name):
+            await self._close_browser_context(name)
+        if self.max_contexts is not None:
+            await self._evict_browser_contexts(self.max_contexts)
+
+    async def _evict_browser_contexts(self, max_count: int) -> None:
+        """Close least recently used idle contexts until there are at most max_count of them.
+        Contexts with pages in use are skipped, they will be closed later if needed."""
+        for name in list(self.contexts):
+            if len(self.contexts) <= max_count:
+                break
+            if self._is_context_idle(name):
+                await self._close_browser_context(name)
+
+    async def _close_browser_context(self, name: str) -> None:
+        context = self.contexts.get(name)
+        if context is not None:
+            self._forget_browser_context(name)
+            logger.debug("Closing browser context: '%s'", name)
+            await context.close()
+
+    def _forget_browser_context(self, name: str) -> None:
+        # a request that was just given the lock counts as active, keep the lock for it
+        lock = self.context_locks.get(name)
+        if lock is not None and not lock.locked() and self._is_context_idle(name):
+            del self.context_locks[name]
+        self.contexts.pop(name, None)
+        self.context_semaphores.pop(name, None)
+        self.context_active_requests.pop(name, None)
+        self.page_pools.pop(name, None)
+        self.context_request_count.pop(name, None)
+
     def _get_total_page_count(self):
         count = sum([len(context.pages) for context in self.contexts.values()])
         current_max_count = self.stats.get_value("playwright/page_count/max_concurrent")
@@ -178,8 +359,15 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
         yield deferred_from_coro(self._close())
 
     async def _close(self) -> None:
+        self._flush_stats()
         self.contexts.clear()
+        self.context_request_count.clear()
+        self.context_locks.clear()
         self.context_semaphores.clear()
+        self.context_active_requests.clear()
+        self.page_pools.clear()
+        self.idle_pages.clear()
+        self.route_handlers.clear()
         if getattr(self, "browser", None):
             logger.info("Closing browser")
             await self.browser.close()
@@ -192,36 +380,37 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
 
     async def _download_request(self, request: Request, spider: Spider) -> Response:
         page = request.meta.get("playwright_page")
-        if not isinstance(page, Page):
-            page = await self._create_page(request)
+        pooled = not isinstance(page, Page)
+        if pooled:
+            page = await self._acquire_page(request)
 
         # attach event handlers
+        attached_handlers: List[Tuple[str, Callable]] = []
         event_handlers = request.meta.get("playwright_page_event_handlers") or {}
         for event, handler in event_handlers.items():
-            if callable(handler):
-                page.on(event, handler)
-            elif isinstance(handler, str):
+            if isinstance(handler, str):
                 try:
-                    page.on(event, getattr(spider, handler))
+                    handler = getattr(spider, handler)
                 except AttributeError:
                     logger.warning(
                         f"Spider '{spider.name}' does not have a '{handler}' attribute,"
                         f" ignoring handler for event '{event}'"
                     )
+                    continue
+            if callable(handler):
+                page.on(event, handler)
+                attached_handlers.append((event, handler))
 
-        await page.unroute("**")
-        await page.route(
-            "**",
-            self._make_request_handler(
+        try:
+            self.route_handlers[page] = self._make_request_handler(
                 method=request.method,
                 scrapy_headers=request.headers,
                 body=request.body,
                 encoding=getattr(request, "encoding", None),
-            ),
-        )
-
-        try:
-            result = await self._download_request_with_page(request, page)
+            )
+            result = await self._download_request_with_page(
+                request, page, attached_handlers if pooled else None
+            )
         except Exception:
             if not page.is_closed():
                 await page.close()
@@ -229,43 +418,71 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
             raise
         else:
             return result
-
-    async def _download_request_with_page(self, request: Request, page: Page) -> Response:
+        finally:
+            self._flush_stats()
+
+    async def _download_request_with_page(
+        self,
+        request: Request,
+        page: Page,
+        event_handlers: Optional[List[Tuple[str, Callable]]] = None,
+    ) -> Response:
         start_time = time()
         response = await page.goto(request.url)
 
-        await self._apply_page_methods(page, request)
-
-        body_str = await page.content()
+        has_page_methods = bool(
+            request.meta.get("playwright_page_methods")
+            or request.meta.get("playwright_page_coroutines")
+        )
+        if has_page_methods:
+            await self._apply_page_methods(page, request)
+
+        # the raw response body can only be used if the page was not modified
+        use_raw_body = request.meta.get("playwright_raw_body") and not has_page_methods
+        include_ip_address = request.meta.get("playwright_include_ip_address", True)
+        include_security_details = request.meta.get(
+            "playwright_include_security_details", self.include_security_details
+        )
+        content, server_ip_address, security_details = await asyncio.gather(
+            response.body() if use_raw_body else page.content(),
+            _get_server_ip_address(response) if include_ip_address else _return_none(),
+            _get_security_details(response) if include_security_details else _return_none(),
+        )
         request.meta["download_latency"] = time() - start_time
+        if include_security_details:
+            request.meta["playwright_security_details"] = security_details
+        # read everything needed from the page before it is reset and returned to the pool
+        page_url = page.url
 
         if request.meta.get("playwright_include_page"):
             request.meta["playwright_page"] = page
+        elif event_handlers is not None and not has_page_methods:
+            # pages modified by page methods (e.g. expose_function, add_init_script) are not reused
+            await self._release_page(page, request.meta["playwright_context"], event_handlers)
         else:
             await page.close()
             self.stats.inc_value("playwright/page_count/closed")
 
-        server_ip_address = None
-        with suppress(AttributeError, KeyError, ValueError):
-            server_addr = await response.server_addr()
-            server_ip_address = ip_address(server_addr["ipAddress"])
-
-        with suppress(AttributeError):
-            request.meta["playwright_security_details"] = await response.security_details()
-
         headers = Headers(response.headers)
         headers.pop("Content-Encoding", None)
-        body, encoding = _encode_body(headers=headers, text=body_str)
-        respcls = responsetypes.from_args(headers=headers, url=page.url, body=body)
+        if isinstance(content, bytes):
+            # let the response class detect the encoding from the headers or the body
+            body, encoding = content, None
+        else:
+            body, encoding = encode_body(headers=headers, text=content)
+        respcls = responsetypes.from_args(headers=headers, url=page_url, body=body)
+        response_kwargs = {}
+        if issubclass(respcls, TextResponse):
+            response_kwargs["encoding"] = encoding
         return respcls(
-            url=page.url,
+            url=page_url,
             status=response.status,
             headers=headers,
             body=body,
             request=request,
             flags=["playwright"],
-            encoding=encoding,
             ip_address=server_ip_address,
+            **response_kwargs,
         )
 
     async def _apply_page_methods(self, page: Page, request: Request) -> None:
@@ -297,41 +514,105 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
 
     def _increment_request_stats(self, request: PlaywrightRequest) -> None:
         stats_prefix = "playwright/request_count"
-        self.stats.inc_value(stats_prefix)
-        self.stats.inc_value(f"{stats_prefix}/resource_type/{request.resource_type}")
-        self.stats.inc_value(f"{stats_prefix}/method/{request.method}")
+        resource_type = request.resource_type
+        method = request.method
+        self._stat_buffer[stats_prefix] += 1
+        self._stat_buffer[
+            self._REQ_RESOURCE_TYPE_KEYS.get(resource_type)
+            or f"{stats_prefix}/resource_type/{resource_type}"
+        ] += 1
+        self._stat_buffer[
+            self._REQ_METHOD_KEYS.get(method) or f"{stats_prefix}/method/{method}"
+        ] += 1
         if request.is_navigation_request():
-            self.stats.inc_value(f"{stats_prefix}/navigation")
+            self._stat_buffer["playwright/request_count/navigation"] += 1
+        self._schedule_stats_flush()
 
     def _increment_response_stats(self, response: PlaywrightResponse) -> None:
         stats_prefix = "playwright/response_count"
-        self.stats.inc_value(stats_prefix)
-        self.stats.inc_value(f"{stats_prefix}/resource_type/{response.request.resource_type}")
-        self.stats.inc_value(f"{stats_prefix}/method/{response.request.method}")
-
-    def _make_close_page_callback(self, context_name: str) -> Callable:
-        def close_page_callback() -> None:
-            if context_name in self.context_semaphores:
-                self.context_semaphores[context_name].release()
-
-        return close_page_callback
+        resource_type = response.request.resource_type
+        method = response.request.method
+        self._stat_buffer[stats_prefix] += 1
+        self._stat_buffer[
+            self._RESP_RESOURCE_TYPE_KEYS.get(resource_type)
+            or f"{stats_prefix}/resource_type/{resource_type}"
+        ] += 1
+        self._stat_buffer[
+            self._RESP_METHOD_KEYS.get(method) or f"{stats_prefix}/method/{method}"
+        ] += 1
+        self._schedule_stats_flush()
+
+    def _schedule_stats_flush(self) -> None:
+        if self._stat_flush_handle is None:
+            loop = asyncio.get_event_loop()
+            self._stat_flush_handle = loop.call_later(STATS_FLUSH_INTERVAL, self._flush_stats)
+
+    def _flush_stats(self) -> None:
+        """Write buffered counts to the stats collector."""
+        if self._stat_flush_handle is not None:
+            self._stat_flush_handle.cancel()
+            self._stat_flush_handle = None
+        for key, count in self._stat_buffer.items():
+            self.stats.inc_value(key, count)
+        self._stat_buffer.clear()
+
+    def _crash_page_callback(self, page: Page) -> None:
+        # the page's semaphore slot is released by the close callback, only once
+        logger.debug("Page crashed, closing it: <%s>", page.url)
+        task = asyncio.ensure_future(_close_page(page))
+        self.close_page_tasks.add(task)
+        task.add_done_callback(self.close_page_tasks.discard)
+
+    def _close_page_callback(self, page: Page) -> None:
+        self.route_handlers.pop(page, None)
+        if page in self.idle_pages:
+            # idle pages do not hold a slot in the context's semaphore
+            self.idle_pages.discard(page)
+            return
+        # look up the context by identity, a newer one might have been created with the same name
+        for name, context in self.contexts.items():
+            if context is page.context:
+                self._release_page_slot(name)
+                break
 
     def _make_close_browser_context_callback(self, name: str) -> Callable:
-        def close_browser_context_callback() -> None:
+        def close_browser_context_callback(context: BrowserContext) -> None:
             logger.debug("Browser context closed: '%s'", name)
-            if name in self.contexts:
-                self.contexts.pop(name)
-            if name in self.context_semaphores:
-                self.context_semaphores.pop(name)
+            # a new context with the same name might have been created in the meantime
+            if self.contexts.get(name) is context:
+                self._forget_browser_context(name)
 
         return close_browser_context_callback
 
+    async def _route_request(self, route: Route, playwright_request: PlaywrightRequest) -> None:
+        """Context-level route, dispatches requests to the handler set for their page."""
+        handler = None
+        with suppress(AttributeError, PlaywrightError):  # e.g. service worker requests
+            handler = self.route_handlers.get(playwright_request.frame.page)
+        if handler is None:
+            await route.continue_()
+        else:
+            await handler(route, playwright_request)
+
     def _make_request_handler(
-        self, method: str, scrapy_headers: Headers, body: Optional[bytes], encoding: str = "utf8"
+        self, method: str, scrapy_headers: Headers, body: bytes, encoding: str = "utf8"
     ) -> Callable:
+        # invariant for all requests handled by this function, resolve them only once
+        blocked_resource_types = self.blocked_resource_types
+        abort_request = self.abort_request
+        navigation_overrides = {"method": method, "post_data": body.decode(encoding)}
+
         async def _request_handler(route: Route, playwright_request: PlaywrightRequest) -> None:
             """Override request headers, method and body."""
-            if self.abort_request and self.abort_request(playwright_request):
+            if (
+                blocked_resource_types
+                and playwright_request.resource_type in blocked_resource_types
+            ):
+                await route.abort()
+                self.stats.inc_value("playwright/request_count/blocked")
+                return None
+
+            if abort_request is not None and abort_request(playwright_request):
                 await route.abort()
                 self.stats.inc_value("playwright/request_count/aborted")
                 return None
@@ -340,34 +621,36 @@ class ScrapyPlaywrightDownloadHandler(HTTPDownloadHandler):
                 self.browser_type, playwright_request, scrapy_headers
             )
 
-            # the request that reaches the callback should contain the headers that were sent
-            scrapy_headers.clear()
-            scrapy_headers.update(processed_headers)
-
-            overrides: dict = {"headers": processed_headers}
             if playwright_request.is_navigation_request():
-                overrides["method"] = method
-                if body is not None:
-                    overrides["post_data"] = body.decode(encoding)
-
-            await route.continue_(**overrides)
+                # the request that reaches the callback should contain the headers that were sent
+                scrapy_headers.clear()
+                scrapy_headers.update(processed_headers)
+                await route.continue_(headers=processed_headers, **navigation_overrides)
+            else:
+                await route.continue_(headers=processed_headers)
 
         return _request_handler
 
 
-def _possible_encodings(headers: Headers, text: str) -> Generator[str, None, None]:
-    if headers.get("content-type"):
-        content_type = to_unicode(headers["content-type"])
-        yield http_content_type_encoding(content_type)
-    yield html_body_declared_encoding(text)
+async def _close_page(page: Page) -> None:
+    with suppress(PlaywrightError):
+        await page.close()
 
 
-def _encode_body(headers: Headers, text: str) -> Tuple[bytes, str]:
-    for encoding in filter(None, _possible_encodings(headers, text)):
-        try:
-            body = text.encode(encoding)
-        except UnicodeEncodeError:
-            pass
-        else:
-            return body, encoding
-    return text.encode("utf-8"), "utf-8"  # fallback
+async def _return_none() -> None:
+    return None
+
+
+async def _get_server_ip_address(
+    response: PlaywrightResponse,
+) -> Optional[Union[IPv4Address, IPv6Address]]:
+    with suppress(AttributeError, KeyError, TypeError, ValueError):
+        server_addr = await response.server_addr()
+        return ip_address(server_addr["ipAddress"])
+    return None
+
+
+async def _get_security_details(response: PlaywrightResponse) -> Optional[dict]:
+    with suppress(AttributeError):
+        return await response.security_details()
+    return None
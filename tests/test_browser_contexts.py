@@ -4,6 +4,8 @@ import platform
 import pytest
 from scrapy import Spider, Request
 
+from scrapy_playwright.page import PageMethod
+
 from tests import make_handler
 from tests.mockserver import StaticMockServer
 
@@ -57,6 +59,206 @@ class MixinTestCaseMultipleContexts:
 
             assert handler.stats.get_value("playwright/page_count/max_concurrent") == 4
 
+    @pytest.mark.asyncio
+    async def test_contexts_reuse_pages(self):
+        settings = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_MAX_PAGES_PER_CONTEXT": 2,
+        }
+        async with make_handler(settings) as handler:
+            with StaticMockServer() as server:
+                for i in range(5):
+                    req = Request(server.urljoin(f"/index.html?a={i}"), meta={"playwright": True})
+                    resp = await handler._download_request(req, Spider("foo"))
+                    assert resp.url == req.url
+
+            assert handler.stats.get_value("playwright/page_count") == 1
+            assert handler.stats.get_value("playwright/page_count/reused") == 4
+            assert handler.stats.get_value("playwright/page_count/closed") is None
+            assert handler.page_pools["default"].qsize() == 1
+            assert len(handler.contexts["default"].pages) == 1
+
+    @pytest.mark.asyncio
+    async def test_contexts_page_methods_not_reused(self):
+        async with make_handler({"PLAYWRIGHT_BROWSER_TYPE": self.browser_type}) as handler:
+            with StaticMockServer() as server:
+                for i in range(2):
+                    req = Request(
+                        server.urljoin(f"/index.html?a={i}"),
+                        meta={
+                            "playwright": True,
+                            "playwright_page_methods": [
+                                PageMethod("expose_function", "double", lambda x: x * 2),
+                            ],
+                        },
+                    )
+                    resp = await handler._download_request(req, Spider("foo"))
+                    assert resp.url == req.url
+
+            assert handler.stats.get_value("playwright/page_count") == 2
+            assert handler.stats.get_value("playwright/page_count/reused") is None
+            assert handler.stats.get_value("playwright/page_count/closed") == 2
+            assert handler.page_pools["default"].qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_contexts_invalid_body_releases_page(self):
+        settings = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_MAX_PAGES_PER_CONTEXT": 1,
+        }
+        async with make_handler(settings) as handler:
+            with StaticMockServer() as server:
+                for _ in range(2):
+                    req = Request(
+                        server.urljoin("/index.html"),
+                        method="POST",
+                        body=b"\xff\xfe",
+                        meta={"playwright": True},
+                    )
+                    with pytest.raises(UnicodeDecodeError):
+                        await asyncio.wait_for(handler._download_request(req, Spider("foo")), 5)
+
+                req = Request(server.urljoin("/index.html"), meta={"playwright": True})
+                resp = await asyncio.wait_for(handler._download_request(req, Spider("foo")), 5)
+                assert resp.status == 200
+
+            assert handler.stats.get_value("playwright/page_count/closed") == 2
+            assert handler.context_active_requests["default"] == 0
+
+    @pytest.mark.asyncio
+    async def test_contexts_crashed_page_releases_slot_once(self):
+        settings = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_MAX_PAGES_PER_CONTEXT": 1,
+        }
+        async with make_handler(settings) as handler:
+            with StaticMockServer() as server:
+                meta = {"playwright": True, "playwright_include_page": True}
+                req = Request(server.urljoin("/index.html"), meta=meta)
+                resp = await handler._download_request(req, Spider("foo"))
+                page = resp.meta["playwright_page"]
+                semaphore = handler.context_semaphores["default"]
+                assert semaphore.locked()
+
+                handler._crash_page_callback(page)
+                assert len(handler.close_page_tasks) == 1
+                await asyncio.gather(*handler.close_page_tasks)
+
+                assert page.is_closed()
+                assert not handler.close_page_tasks
+                assert handler.context_active_requests["default"] == 0
+                # exactly one slot is available, the semaphore was released only once
+                await semaphore.acquire()
+                assert semaphore.locked()
+                semaphore.release()
+
+                req = Request(server.urljoin("/index.html"), meta={"playwright": True})
+                resp = await asyncio.wait_for(handler._download_request(req, Spider("foo")), 5)
+                assert resp.status == 200
+
+    @pytest.mark.asyncio
+    async def test_contexts_dynamic_concurrent(self):
+        async with make_handler({"PLAYWRIGHT_BROWSER_TYPE": self.browser_type}) as handler:
+            with StaticMockServer() as server:
+                requests = [
+                    handler._download_request(
+                        Request(
+                            server.urljoin(f"/index.html?a={i}"),
+                            meta={"playwright": True, "playwright_context": "new"},
+                        ),
+                        Spider("foo"),
+                    )
+                    for i in range(5)
+                ]
+                await asyncio.gather(*requests)
+
+            assert len(handler.contexts) == 1
+            assert handler.stats.get_value("playwright/context_count") == 1
+
+    @pytest.mark.asyncio
+    async def test_contexts_max_contexts(self):
+        settings = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_MAX_CONTEXTS": 2,
+        }
+        async with make_handler(settings) as handler:
+            with StaticMockServer() as server:
+                for name in ("a", "b", "a", "c"):
+                    req = Request(
+                        server.urljoin("/index.html"),
+                        meta={"playwright": True, "playwright_context": name},
+                    )
+                    await handler._download_request(req, Spider("foo"))
+
+            assert list(handler.contexts) == ["a", "c"]
+            assert sorted(handler.context_locks) == ["a", "c"]
+            assert handler.stats.get_value("playwright/context_count") == 3
+
+    @pytest.mark.asyncio
+    async def test_contexts_max_requests(self):
+        settings = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_MAX_REQUESTS_PER_CONTEXT": 2,
+        }
+        async with make_handler(settings) as handler:
+            with StaticMockServer() as server:
+                for i in range(3):
+                    req = Request(server.urljoin(f"/index.html?a={i}"), meta={"playwright": True})
+                    await handler._download_request(req, Spider("foo"))
+
+            assert list(handler.contexts) == ["default"]
+            assert handler.context_request_count["default"] == 1
+            assert handler.context_active_requests["default"] == 0
+            assert handler.stats.get_value("playwright/context_count") == 2
+
+    @pytest.mark.asyncio
+    async def test_contexts_max_requests_concurrent(self):
+        settings = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_MAX_PAGES_PER_CONTEXT": 1,
+            "PLAYWRIGHT_MAX_REQUESTS_PER_CONTEXT": 2,
+        }
+        async with make_handler(settings) as handler:
+            with StaticMockServer() as server:
+                requests = [
+                    handler._download_request(
+                        Request(server.urljoin(f"/index.html?a={i}"), meta={"playwright": True}),
+                        Spider("foo"),
+                    )
+                    for i in range(5)
+                ]
+                responses = await asyncio.wait_for(asyncio.gather(*requests), 30)
+
+            assert [resp.status for resp in responses] == [200] * 5
+            assert not handler.context_active_requests.get("default")
+            assert set(handler.context_locks) <= set(handler.contexts)
+
+    @pytest.mark.asyncio
+    async def test_contexts_max_contexts_concurrent(self):
+        settings = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_MAX_PAGES_PER_CONTEXT": 2,
+            "PLAYWRIGHT_MAX_CONTEXTS": 2,
+        }
+        async with make_handler(settings) as handler:
+            with StaticMockServer() as server:
+                requests = [
+                    handler._download_request(
+                        Request(
+                            server.urljoin(f"/index.html?a={i}"),
+                            meta={"playwright": True, "playwright_context": "abcd"[i % 4]},
+                        ),
+                        Spider("foo"),
+                    )
+                    for i in range(20)
+                ]
+                responses = await asyncio.wait_for(asyncio.gather(*requests), 30)
+
+            assert [resp.status for resp in responses] == [200] * 20
+            assert len(handler.contexts) <= 2
+            assert all(count == 0 for count in handler.context_active_requests.values())
+            assert set(handler.context_locks) <= set(handler.contexts)
+
     @pytest.mark.asyncio
     async def test_contexts_startup(self):
         settings = {
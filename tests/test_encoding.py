@@ -1,7 +1,7 @@
 import pytest
 from scrapy.http.headers import Headers
 
-from scrapy_playwright.handler import _encode_body
+from scrapy_playwright._fastpath import content_type_encoding, encode_body
 
 
 def body_str(charset: str, content: str = "áéíóú") -> str:
@@ -22,7 +22,7 @@ def body_str(charset: str, content: str = "áéíóú") -> str:
 async def test_encode_from_headers():
     """Charset declared in headers takes precedence"""
     text = body_str("gb2312")
-    body, encoding = _encode_body(
+    body, encoding = encode_body(
         headers=Headers({"content-type": "text/html; charset=ISO-8859-1"}),
         text=text,
     )
@@ -34,7 +34,7 @@ async def test_encode_from_headers():
 async def test_encode_from_body():
     """No charset declared in headers, use the one declared in the body"""
     text = body_str("gb2312")
-    body, encoding = _encode_body(headers=Headers({}), text=text)
+    body, encoding = encode_body(headers=Headers({}), text=text)
     assert encoding == "gb18030"
     assert body == text.encode(encoding)
 
@@ -43,7 +43,7 @@ async def test_encode_from_body():
 async def test_encode_fallback():
     """No charset declared, use utf-8 as fallback"""
     text = "<html>áéíóú</html>"
-    body, encoding = _encode_body(headers=Headers(), text=text)
+    body, encoding = encode_body(headers=Headers(), text=text)
     assert encoding == "utf-8"
     assert body == text.encode(encoding)
 
@@ -54,9 +54,41 @@ async def test_encode_mismatch():
     one fails to encode: use the one in the body (first one that works)
     """
     text = body_str("gb2312", content="空手道")
-    body, encoding = _encode_body(
+    body, encoding = encode_body(
         headers=Headers({"content-type": "text/html; charset=ISO-8859-1"}),
         text=text,
     )
     assert encoding == "gb18030"
     assert body == text.encode(encoding)
+
+
+@pytest.mark.asyncio
+async def test_encode_ascii():
+    """Ascii text, the declared charset is used even if it makes no difference for the body"""
+    text = body_str("gb2312", content="abc")
+    body, encoding = encode_body(headers=Headers(), text=text)
+    assert encoding == "gb18030"
+    assert body == text.encode(encoding)
+
+    text = "<html>abc</html>"
+    body, encoding = encode_body(headers=Headers(), text=text)
+    assert encoding == "utf-8"
+    assert body == text.encode(encoding)
+
+    body, encoding = encode_body(
+        headers=Headers({"content-type": "text/html; charset=ISO-8859-1"}),
+        text=text,
+    )
+    assert encoding == "cp1252"
+    assert body == text.encode(encoding)
+
+
+@pytest.mark.asyncio
+async def test_content_type_encoding_cache():
+    content_type_encoding.cache_clear()
+    headers = Headers({"content-type": "text/html; charset=ISO-8859-1"})
+    for _ in range(3):
+        encode_body(headers=headers, text=body_str("gb2312"))
+    cache_info = content_type_encoding.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
@@ -396,6 +396,7 @@ class MixinTestCase:
                 response = await handler._download_request(req, spider)
 
         assert response.ip_address == ip_address(server.address)
+        assert "playwright_security_details" not in response.meta
 
     @pytest.mark.asyncio
     async def test_abort_requests(self):
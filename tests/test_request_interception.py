@@ -0,0 +1,66 @@
+import platform
+
+import pytest
+from scrapy import Spider, Request
+
+from tests import make_handler
+from tests.mockserver import StaticMockServer
+
+
+class MixinTestCaseRequestInterception:
+    @pytest.mark.asyncio
+    async def test_request_headers_from_navigation(self):
+        """The Scrapy request headers are the ones sent for the navigation request"""
+
+        async def resource_type_headers(browser_type, playwright_request, scrapy_headers) -> dict:
+            return {"X-Resource-Type": playwright_request.resource_type}
+
+        settings_dict = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_PROCESS_REQUEST_HEADERS": resource_type_headers,
+        }
+        async with make_handler(settings_dict) as handler:
+            with StaticMockServer() as server:
+                req = Request(url=server.urljoin("/gallery.html"), meta={"playwright": True})
+                await handler._download_request(req, Spider("foo"))
+
+                image_count = "playwright/request_count/resource_type/image"
+                assert handler.stats.get_value(image_count) == 3
+                assert list(req.headers.keys()) == [b"X-Resource-Type"]
+                assert req.headers.getlist("X-Resource-Type") == [b"document"]
+
+    @pytest.mark.asyncio
+    async def test_block_resource_types(self):
+        settings_dict = {
+            "PLAYWRIGHT_BROWSER_TYPE": self.browser_type,
+            "PLAYWRIGHT_BLOCK_RESOURCE_TYPES": ["image"],
+        }
+        async with make_handler(settings_dict) as handler:
+            with StaticMockServer() as server:
+                req = Request(
+                    url=server.urljoin("/gallery.html"),
+                    meta={"playwright": True},
+                )
+                await handler._download_request(req, Spider("foo"))
+
+                req_prefix = "playwright/request_count"
+                resp_prefix = "playwright/response_count"
+                assert handler.stats.get_value(f"{req_prefix}/resource_type/document") == 1
+                assert handler.stats.get_value(f"{req_prefix}/resource_type/image") == 3
+                assert handler.stats.get_value(f"{resp_prefix}/resource_type/document") == 1
+                assert handler.stats.get_value(f"{resp_prefix}/resource_type/image") is None
+                assert handler.stats.get_value(f"{req_prefix}/blocked") == 3
+                assert handler.stats.get_value(f"{req_prefix}/aborted") is None
+
+
+class TestCaseRequestInterceptionChromium(MixinTestCaseRequestInterception):
+    browser_type = "chromium"
+
+
+class TestCaseRequestInterceptionFirefox(MixinTestCaseRequestInterception):
+    browser_type = "firefox"
+
+
+@pytest.mark.skipif(platform.system() != "Darwin", reason="Test WebKit only on Darwin")
+class TestCaseRequestInterceptionWebkit(MixinTestCaseRequestInterception):
+    browser_type = "webkit"
@@ -0,0 +1,57 @@
+import platform
+from pathlib import Path
+
+import pytest
+from scrapy import Spider, Request
+from scrapy.http.response.html import HtmlResponse
+
+from tests import make_handler
+from tests.mockserver import MockServer, StaticMockServer
+
+
+class MixinTestCaseResponseAttributes:
+    @pytest.mark.asyncio
+    async def test_raw_body(self):
+        async with make_handler({"PLAYWRIGHT_BROWSER_TYPE": self.browser_type}) as handler:
+            with StaticMockServer() as server:
+                meta = {"playwright": True, "playwright_raw_body": True}
+                req = Request(server.urljoin("/index.html"), meta=meta)
+                resp = await handler._download_request(req, Spider("foo"))
+                with open(Path(__file__).parent / "site/index.html", "rb") as fp:
+                    expected_body = fp.read()
+
+            assert isinstance(resp, HtmlResponse)
+            assert resp.url == req.url
+            assert resp.status == 200
+            assert resp.body == expected_body
+            assert resp.css("a::text").getall() == ["Lorem Ipsum", "Infinite Scroll"]
+
+    @pytest.mark.asyncio
+    async def test_response_attributes_meta_keys(self):
+        async with make_handler({"PLAYWRIGHT_BROWSER_TYPE": self.browser_type}) as handler:
+            with MockServer() as server:
+                req = Request(
+                    url=server.urljoin("/index.html"),
+                    meta={
+                        "playwright": True,
+                        "playwright_include_ip_address": False,
+                        "playwright_include_security_details": True,
+                    },
+                )
+                response = await handler._download_request(req, Spider("foo"))
+
+        assert response.ip_address is None
+        assert "playwright_security_details" in response.meta
+
+
+class TestCaseResponseAttributesChromium(MixinTestCaseResponseAttributes):
+    browser_type = "chromium"
+
+
+class TestCaseResponseAttributesFirefox(MixinTestCaseResponseAttributes):
+    browser_type = "firefox"
+
+
+@pytest.mark.skipif(platform.system() != "Darwin", reason="Test WebKit only on Darwin")
+class TestCaseResponseAttributesWebkit(MixinTestCaseResponseAttributes):
+    browser_type = "webkit"